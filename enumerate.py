@@ -24,6 +24,12 @@ Solution Strategy:
     2. Verification: Validates each model's availability in the target region (e.g., europe-west4)
        by attempting to retrieve the specific model resource from that region's API endpoint.
        This "Ping Test" filters out models that are defined globally but not deployed regionally.
+       Answers are cached on disk (see CACHE_FILE) so repeat runs skip most of the RPCs.
+    3. Optional shortcut (--trust-regional-listing): Lists the publisher's models from the
+       regional endpoint and intersects that with the Master Catalog instead of pinging each
+       model. The listing request names no location, so a region may simply echo the global
+       catalog; if the listing covers the whole Master Catalog it is treated as unfiltered
+       and the Ping Test runs anyway.
 
 Usage:
     uv run enumerate.py --region europe-west4 --project my-project-id
@@ -34,12 +40,15 @@ import sys
 import argparse
 import logging
 import json
-from typing import Optional, List, Any
-import concurrent.futures
+import time
+import asyncio
+from typing import Optional, List, Any, AsyncIterator, Dict, Set, Tuple
 
+import google.auth
 from dotenv import load_dotenv
 from google.cloud import aiplatform_v1beta1
-from google.api_core import exceptions
+from google.cloud.aiplatform_v1beta1.services.model_garden_service.transports import ModelGardenServiceGrpcAsyncIOTransport
+from google.api_core import exceptions, retry_async
 
 # Configure logging to stderr so stdout remains clean for piping output to files.
 logging.basicConfig(
@@ -52,6 +61,58 @@ logger = logging.getLogger(__name__)
 # List of popular Model Garden publishers to check when --publisher=all is used
 POPULAR_PUBLISHERS = ["google", "anthropic", "meta", "mistralai", "cohere", "ai21"]
 
+# In-process cache of regional catalog listings, keyed by (region, publisher).
+_REGIONAL_CATALOG_CACHE: Dict[Tuple[str, str], Set[str]] = {}
+
+# On-disk cache so warm runs skip the network. Regional availability changes on the
+# order of days; the master catalog is refreshed more often to pick up new launches.
+CACHE_DIR = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "vertex-maas")
+CACHE_FILE = os.path.join(CACHE_DIR, "cache.json")
+AVAILABILITY_CACHE_TTL = 24 * 60 * 60
+CATALOG_CACHE_TTL = 60 * 60
+
+# Maximum Ping Test RPCs in flight at once, to avoid server-side throttling.
+MAX_CONCURRENT_CHECKS = 200
+
+# A Ping Test is a tiny "does this exist" probe, so fail fast instead of waiting out the
+# client's default (multi-minute) timeout; one stuck connection would otherwise stall the sweep.
+PING_TIMEOUT = 3.0
+
+# Rate limiting (429), unavailability (503) and timeouts are transient; reporting them as
+# "not available" would silently drop models from the output. Retry them with jittered
+# exponential backoff (1s, 2s, 4s, ... capped at 15s) before giving up. Other errors are not retried.
+PING_RETRY = retry_async.AsyncRetry(
+    predicate=retry_async.if_exception_type(
+        exceptions.ResourceExhausted,
+        exceptions.ServiceUnavailable,
+        exceptions.DeadlineExceeded,
+    ),
+    initial=1.0,
+    maximum=15.0,
+    multiplier=2.0,
+    deadline=30.0,
+)
+
+# Minimum seconds between "Checked N models..." progress lines on stderr.
+PROGRESS_LOG_INTERVAL = 2.0
+
+# The 'global' endpoint (aiplatform.googleapis.com) often returns a filtered list,
+# so we use us-central1 for the most complete discovery.
+DISCOVERY_ENDPOINT = "us-central1-aiplatform.googleapis.com"
+
+# gRPC channel options. All RPCs to an endpoint share one HTTP/2 connection; keepalive
+# pings hold it open between publishers so we pay the TCP+TLS handshake only once.
+CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.http2.max_pings_without_data", 0),
+    # Match the generated transport's defaults; catalog pages can be large.
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+class DiscoveryError(Exception):
+    """Raised when the Master Catalog cannot be listed."""
+
 def get_project_id(arg_project: Optional[str]) -> str:
     """
     Determines the Google Cloud Project ID.
@@ -79,31 +140,259 @@ def get_project_id(arg_project: Optional[str]) -> str:
     logger.error("Could not determine Project ID. Set GOOGLE_CLOUD_PROJECT env var or use --project.")
     sys.exit(1)
 
-def check_model_availability(client: aiplatform_v1beta1.ModelGardenServiceClient, model_name: str) -> bool:
+def positive_int(value: str) -> int:
+    """argparse type for flags that must be an integer greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+def positive_float(value: str) -> float:
+    """argparse type for flags that must be a number greater than zero."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {value!r}")
+    if not number > 0 or number == float("inf"):
+        raise argparse.ArgumentTypeError(f"must be a finite number greater than 0, got {value}")
+    return number
+
+def load_cache() -> Dict[str, Any]:
+    """
+    Loads the on-disk cache. A missing or unreadable cache file yields an empty cache,
+    and malformed entries are dropped.
+
+    Returns:
+        Dict[str, Any]: Mapping of cache key to {"value": ..., "checked_at": <epoch seconds>}.
+    """
+    try:
+        with open(CACHE_FILE) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache file {CACHE_FILE}: {e}")
+        return {}
+
+    if not isinstance(data, dict):
+        logger.warning(f"Ignoring malformed cache file {CACHE_FILE}: expected a JSON object.")
+        return {}
+    return {
+        key: entry for key, entry in data.items()
+        if isinstance(entry, dict)
+        and "value" in entry
+        and isinstance(entry.get("checked_at"), (int, float))
+    }
+
+def save_cache(cache: Dict[str, Any], max_age: float) -> None:
+    """
+    Persists the cache to disk, dropping entries older than max_age seconds so the
+    file does not grow without bound. Failures are logged and otherwise ignored.
+
+    Args:
+        cache: The cache mapping returned by load_cache().
+        max_age: Age in seconds beyond which no entry will be trusted again.
+    """
+    now = time.time()
+    fresh = {key: entry for key, entry in cache.items() if now - entry["checked_at"] <= max_age}
+
+    # Write to a temp file and rename so a concurrent run never reads a partial file.
+    tmp_path = f"{CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(fresh, f)
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Failed to write cache file {CACHE_FILE}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def cache_key(*parts: str) -> str:
+    """Builds a flat string key, since JSON object keys cannot be tuples."""
+    return "|".join(parts)
+
+def cache_get(cache: Dict[str, Any], key: str, ttl: float) -> Optional[Any]:
+    """
+    Returns the cached value for key, or None if absent or older than ttl seconds.
+    """
+    entry = cache.get(key)
+    if entry is None or time.time() - entry["checked_at"] > ttl:
+        return None
+    return entry["value"]
+
+def cache_set(cache: Dict[str, Any], key: str, value: Any) -> None:
+    """
+    Stores value under key, stamped with the current time.
+    """
+    cache[key] = {"value": value, "checked_at": time.time()}
+
+def create_client(
+    endpoint: str, credentials: Optional[google.auth.credentials.Credentials] = None
+) -> aiplatform_v1beta1.ModelGardenServiceAsyncClient:
+    """
+    Creates a ModelGardenServiceAsyncClient backed by a single explicitly configured gRPC channel.
+
+    Must be called from within a running event loop, since the channel binds to it.
+
+    Args:
+        endpoint: The API endpoint host (e.g., "europe-west4-aiplatform.googleapis.com").
+        credentials: Credentials to attach to the channel. Defaults to Application Default Credentials.
+
+    Returns:
+        ModelGardenServiceAsyncClient: A client whose RPCs all share one channel.
+    """
+    channel = ModelGardenServiceGrpcAsyncIOTransport.create_channel(
+        f"{endpoint}:443", credentials=credentials, options=CHANNEL_OPTIONS
+    )
+    transport = ModelGardenServiceGrpcAsyncIOTransport(host=endpoint, channel=channel)
+    return aiplatform_v1beta1.ModelGardenServiceAsyncClient(transport=transport)
+
+async def check_model_availability(
+    client: aiplatform_v1beta1.ModelGardenServiceAsyncClient, model_name: str, timeout: float = PING_TIMEOUT
+) -> Optional[bool]:
     """
     Verifies if a specific model resource exists in the region connected to by the client.
     
     This acts as a "Ping Test". If the API returns the model details, it is available.
-    If it returns a 404 or other error, it is considered unavailable in this region.
+    If it returns a 404, it is unavailable in this region. Any other error leaves the
+    answer undetermined; callers treat it as unavailable but must not cache it.
 
     Args:
-        client: An initialized ModelGardenServiceClient pointing to the target regional endpoint.
+        client: An initialized ModelGardenServiceAsyncClient pointing to the target regional endpoint.
         model_name: The full resource name of the model (e.g., "publishers/google/models/gemini-pro").
+        timeout: Per-attempt RPC deadline in seconds.
 
     Returns:
-        bool: True if available, False otherwise.
+        Optional[bool]: True if available, False if not, None if the check itself failed.
     """
     try:
-        client.get_publisher_model(name=model_name)
+        await client.get_publisher_model(name=model_name, timeout=timeout, retry=PING_RETRY)
         return True
     except exceptions.NotFound:
         # 404: The model is not available in this region.
         return False
+    except (exceptions.RetryError, exceptions.ResourceExhausted, exceptions.ServiceUnavailable, exceptions.DeadlineExceeded) as e:
+        # Still failing after retries; report unavailable for this run only.
+        logger.warning(f"Ping Test for {model_name} gave up after retries: {e}")
+        return None
     except Exception:
-        # Any other error (e.g., 403 Permission, 500 Server) also implies we can't use it.
-        return False
+        # Any other error (e.g., 403 Permission, 400 Bad Request) is not retried and means we can't use it right now.
+        return None
+
+def canonical_model_name(model_name: str) -> str:
+    """
+    Strips any "@version" suffix, e.g. "publishers/google/models/gemini-pro@001" -> "publishers/google/models/gemini-pro".
+    """
+    return model_name.split("@")[0]
 
-def fetch_models(project_id: str, region: str, publisher: str = "google") -> List[Any]:
+async def list_regional_model_names(
+    client: aiplatform_v1beta1.ModelGardenServiceAsyncClient, region: str, publisher: str
+) -> Optional[Set[str]]:
+    """
+    Attempts to list the publisher's models directly from the regional endpoint.
+
+    When the regional endpoint serves the listing API, a single paged call replaces
+    one Ping Test per model. Many regions answer 404 (or an empty list) instead, in
+    which case the caller must fall back to the Ping Test.
+
+    Args:
+        client: An initialized ModelGardenServiceAsyncClient pointing to the target regional endpoint.
+        region: The region the client is connected to (used as the cache key).
+        publisher: The model publisher to list.
+
+    Returns:
+        Optional[Set[str]]: The resource names listed by the region, or None if unavailable.
+    """
+    listing_key = (region, publisher)
+    if listing_key in _REGIONAL_CATALOG_CACHE:
+        return _REGIONAL_CATALOG_CACHE[listing_key]
+
+    try:
+        response = await client.list_publisher_models(parent=f"publishers/{publisher}")
+        names: Set[str] = {model.name async for model in response}
+    except exceptions.NotFound:
+        logger.info(f"Regional listing not supported in {region}; falling back to Ping Test.")
+        return None
+    except Exception as e:
+        logger.warning(f"Regional listing failed in {region} ({e}); falling back to Ping Test.")
+        return None
+
+    if not names:
+        logger.info(f"Regional listing in {region} returned no models; falling back to Ping Test.")
+        return None
+
+    _REGIONAL_CATALOG_CACHE[listing_key] = names
+    return names
+
+async def _iter_models(models: List[Any]) -> AsyncIterator[Any]:
+    """Replays an already-fetched catalog as an async iterator."""
+    for model in models:
+        yield model
+
+async def iter_catalog(
+    discovery_client: aiplatform_v1beta1.ModelGardenServiceAsyncClient, publisher: str, cache: Dict[str, Any]
+) -> AsyncIterator[Any]:
+    """
+    Yields the publisher's Master Catalog, from the cache when fresh, else streamed from the API.
+
+    Models are yielded as each page arrives, so callers can start Ping Tests while later
+    pages are still being fetched. A complete listing is written back to the cache.
+
+    Args:
+        discovery_client: Client for the Master Catalog endpoint (us-central1).
+        publisher: The model publisher to list.
+        cache: The on-disk cache, updated in place with a freshly listed catalog.
+
+    Yields:
+        PublisherModel objects from the Master Catalog (only `name` is set when served from the cache).
+
+    Raises:
+        DiscoveryError: If listing the catalog fails, including partway through the pager.
+    """
+    catalog_key = cache_key("catalog", publisher)
+    cached_catalog = cache_get(cache, catalog_key, CATALOG_CACHE_TTL)
+    if isinstance(cached_catalog, list) and all(isinstance(name, str) for name in cached_catalog):
+        logger.info(f"Discovery: Loaded {len(cached_catalog)} {publisher} models from cache.")
+        for name in cached_catalog:
+            yield aiplatform_v1beta1.PublisherModel(name=name)
+        return
+
+    logger.info(f"Discovery: Fetching full {publisher} catalog from {DISCOVERY_ENDPOINT}...")
+    discovered = []
+    try:
+        # List all models for the publisher; the pager fetches further pages lazily.
+        response = await discovery_client.list_publisher_models(parent=f"publishers/{publisher}")
+        async for model in response:
+            discovered.append(model)
+            yield model
+    except Exception as e:
+        raise DiscoveryError(f"Failed to discover {publisher} models: {e}") from e
+
+    logger.info(f"Discovery: Found {len(discovered)} {publisher} models in Master Catalog.")
+    # Only resource names are cached: they are all the filtering and output need,
+    # and a full PublisherModel dump is many times larger.
+    cache_set(cache, catalog_key, [m.name for m in discovered])
+
+async def fetch_models(
+    project_id: str,
+    region: str,
+    publisher: str = "google",
+    *,
+    discovery_client: aiplatform_v1beta1.ModelGardenServiceAsyncClient,
+    region_client: Optional[aiplatform_v1beta1.ModelGardenServiceAsyncClient] = None,
+    cache: Dict[str, Any],
+    max_qps: Optional[float] = None,
+    max_workers: int = MAX_CONCURRENT_CHECKS,
+    rpc_timeout: float = PING_TIMEOUT,
+    cache_ttl: float = AVAILABILITY_CACHE_TTL,
+    use_regional_listing: bool = False,
+) -> List[Any]:
     """
     Fetches the full catalog of models and filters them by regional availability.
 
@@ -111,72 +400,225 @@ def fetch_models(project_id: str, region: str, publisher: str = "google") -> Lis
         project_id: The Google Cloud Project ID.
         region: The target region to check availability for (e.g., "europe-west4").
         publisher: The model publisher to filter by (default: "google").
+        discovery_client: Client for the Master Catalog endpoint (us-central1).
+        region_client: Client for the target region. Required unless region is us-central1.
+        cache: The on-disk cache (see load_cache), updated in place; the caller saves it.
+        max_qps: Optional ceiling on Ping Tests started per second.
+        max_workers: Maximum Ping Tests in flight at once.
+        rpc_timeout: Per-attempt Ping Test deadline in seconds.
+        cache_ttl: Seconds to trust a cached availability result.
+        use_regional_listing: Try the regional listing shortcut before the Ping Test.
 
     Returns:
         List[Any]: A list of available PublisherModel objects.
     """
-    # 1. Discovery: Get ALL models from the Master Catalog (us-central1)
-    # The 'global' endpoint (aiplatform.googleapis.com) often returns a filtered list,
-    # so we use us-central1 for the most complete discovery.
-    discovery_endpoint = "us-central1-aiplatform.googleapis.com"
-    logger.info(f"Discovery: Fetching full catalog from {discovery_endpoint}...")
-    
-    discovery_client = aiplatform_v1beta1.ModelGardenServiceClient(
-        client_options={"api_endpoint": discovery_endpoint}
-    )
-    
-    parent = f"publishers/{publisher}"
-    try:
-        # List all models for the publisher
-        response = discovery_client.list_publisher_models(parent=parent)
-        all_models = list(response)
-        logger.info(f"Discovery: Found {len(all_models)} models in Master Catalog.")
-    except Exception as e:
-        logger.error(f"Failed to discover models: {e}")
-        sys.exit(1)
+    # 1. Discovery: Stream ALL models from the Master Catalog (us-central1)
+    catalog = iter_catalog(discovery_client, publisher, cache)
 
     # 2. Filtering: If target region is NOT us-central1, verify availability
     # We assume if the user asks for us-central1, the discovery list is sufficient.
     if region == "us-central1":
+        available_models = [model async for model in catalog]
         logger.info("Region is us-central1; returning full discovery catalog.")
-        return all_models
-    
-    logger.info(f"Filtering: Verifying availability in {region} for {len(all_models)} models...")
-    
-    # Client for the target region to perform the "Ping Test"
-    region_client = aiplatform_v1beta1.ModelGardenServiceClient(
-        client_options={"api_endpoint": f"{region}-aiplatform.googleapis.com"}
-    )
-
-    available_models = []
-    
-    # Use ThreadPool to check in parallel as these are simple I/O bound HTTP GETs.
-    # A high worker count (50) significantly speeds up checking 100+ models.
-    with concurrent.futures.ThreadPoolExecutor(max_workers=50) as executor:
-        # Submit all checks
-        future_to_model = {
-            executor.submit(check_model_availability, region_client, model.name): model 
-            for model in all_models
-        }
-        
-        count = 0
-        total = len(all_models)
-        
-        # Process results as they complete
-        for future in concurrent.futures.as_completed(future_to_model):
-            model = future_to_model[future]
-            is_available = future.result()
-            count += 1
-            
-            # Log progress every 20 models
-            if count % 20 == 0:
-                logger.info(f"Checked {count}/{total} models...")
-            
-            if is_available:
-                available_models.append(model)
+    else:
+        assert region_client is not None, "region_client is required when region is not us-central1"
+        available_models = await _filter_by_region(
+            region_client, region, publisher, catalog, cache,
+            max_qps=max_qps, max_workers=max_workers, rpc_timeout=rpc_timeout, cache_ttl=cache_ttl,
+            use_regional_listing=use_regional_listing,
+        )
 
     return available_models
 
+async def _filter_by_region(
+    region_client: aiplatform_v1beta1.ModelGardenServiceAsyncClient,
+    region: str,
+    publisher: str,
+    catalog: AsyncIterator[Any],
+    cache: Dict[str, Any],
+    max_qps: Optional[float] = None,
+    max_workers: int = MAX_CONCURRENT_CHECKS,
+    rpc_timeout: float = PING_TIMEOUT,
+    cache_ttl: float = AVAILABILITY_CACHE_TTL,
+    use_regional_listing: bool = False,
+) -> List[Any]:
+    """
+    Filters the master catalog down to the models available in the target region.
+
+    Args:
+        region_client: An initialized ModelGardenServiceAsyncClient pointing to the target regional endpoint.
+        region: The target region (e.g., "europe-west4").
+        publisher: The model publisher being filtered.
+        catalog: The master catalog for the publisher, as returned by iter_catalog().
+        cache: The on-disk cache, updated in place with fresh Ping Test results.
+        max_qps: Optional ceiling on Ping Tests started per second.
+        max_workers: Maximum Ping Tests in flight at once.
+        rpc_timeout: Per-attempt Ping Test deadline in seconds.
+        cache_ttl: Seconds to trust a cached availability result.
+        use_regional_listing: Try the regional listing shortcut before the Ping Test.
+
+    Returns:
+        List[Any]: A list of available PublisherModel objects, in catalog order.
+    """
+    # Opt-in fast path: if the region lists its own models, intersect locally instead of pinging each one.
+    if use_regional_listing:
+        regional_names: Optional[Set[str]] = await list_regional_model_names(region_client, region, publisher)
+        if regional_names:
+            all_models = [model async for model in catalog]
+            # regional_names is a set, so the intersection is O(N) rather than O(N*M).
+            available_models = [m for m in all_models if m.name in regional_names]
+            if len(available_models) < len(all_models):
+                logger.info(f"Filtering: Regional listing in {region} matched {len(available_models)}/{len(all_models)} {publisher} models.")
+                return available_models
+            # A listing that covers the whole Master Catalog is almost certainly the
+            # unfiltered global catalog, which says nothing about this region.
+            logger.warning(
+                f"Regional listing in {region} covers the entire {publisher} Master Catalog; "
+                f"treating it as unfiltered and falling back to Ping Test."
+            )
+            catalog = _iter_models(all_models)
+
+    logger.info(f"Filtering: Verifying availability of {publisher} models in {region} as the catalog streams in...")
+
+    # These are simple I/O bound RPCs, so multiplex them on one event loop rather than
+    # a thread per request. A sliding window starts a new check only when one finishes,
+    # which smooths QPS against the regional endpoint instead of ramping all at once.
+    async def check(model_name: str) -> Tuple[str, Optional[bool]]:
+        return model_name, await check_model_availability(region_client, model_name, rpc_timeout)
+
+    all_models = []
+    # Availability per canonical model name (see canonical_model_name).
+    availability: Dict[str, bool] = {}
+    seen: Set[str] = set()
+    in_flight: Set[asyncio.Task] = set()
+    submit_interval = 1.0 / max_qps if max_qps else 0.0
+    cache_hits = 0
+    count = 0
+    last_log = time.monotonic()
+
+    def record(done: Set[asyncio.Task]) -> None:
+        nonlocal count, last_log
+        for task in done:
+            model_name, is_available = task.result()
+
+            # Only definitive answers are cached; transient failures are retried next run.
+            if is_available is not None:
+                cache_set(cache, cache_key("availability", region, publisher, model_name), is_available)
+            availability[model_name] = bool(is_available)
+        count += len(done)
+
+        # Log progress at most once per interval, however many checks complete.
+        now = time.monotonic()
+        if now - last_log >= PROGRESS_LOG_INTERVAL:
+            logger.info(f"Checked {count} {publisher} models...")
+            last_log = now
+
+    try:
+        async for model in catalog:
+            all_models.append(model)
+
+            # Versioned duplicates (e.g. "@001", "@latest") resolve to the same resource, so
+            # Ping each canonical model once and apply the answer to every version.
+            model_name = canonical_model_name(model.name)
+            if model_name in seen:
+                continue
+            seen.add(model_name)
+
+            # Answer what we can from the cache; only the misses need a Ping Test.
+            cached = cache_get(cache, cache_key("availability", region, publisher, model_name), cache_ttl)
+            if cached is not None:
+                availability[model_name] = cached
+                cache_hits += 1
+                continue
+
+            while len(in_flight) >= max_workers:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                record(done)
+            in_flight.add(asyncio.ensure_future(check(model_name)))
+            if submit_interval:
+                await asyncio.sleep(submit_interval)
+
+        # Drain the remaining checks
+        if in_flight:
+            done, in_flight = await asyncio.wait(in_flight)
+            record(done)
+    except BaseException:
+        # Discovery failed (or we were cancelled) mid-stream: keep the answers we
+        # already have so the caller can cache them, and stop the rest.
+        record({task for task in in_flight if task.done() and not task.cancelled()})
+        for task in in_flight:
+            task.cancel()
+        raise
+
+    if len(all_models) > len(seen):
+        logger.info(f"Filtering: Skipped {len(all_models) - len(seen)} duplicate {publisher} model versions.")
+    logger.info(f"Filtering: {cache_hits} {publisher} models answered from cache; {count} verified in {region}.")
+
+    return [m for m in all_models if availability[canonical_model_name(m.name)]]
+
+async def fetch_all_models(
+    project_id: str,
+    region: str,
+    publishers: List[str],
+    max_qps: Optional[float] = None,
+    max_workers: int = MAX_CONCURRENT_CHECKS,
+    rpc_timeout: float = PING_TIMEOUT,
+    use_cache: bool = True,
+    cache_ttl: float = AVAILABILITY_CACHE_TTL,
+    use_regional_listing: bool = False,
+) -> Dict[str, List[Any]]:
+    """
+    Runs fetch_models for each publisher, sharing one client (and channel) per endpoint.
+
+    Args:
+        project_id: The Google Cloud Project ID.
+        region: The target region to check availability for (e.g., "europe-west4").
+        publishers: The model publishers to enumerate.
+        max_qps: Optional ceiling on Ping Tests started per second.
+        max_workers: Maximum Ping Tests in flight at once.
+        rpc_timeout: Per-attempt Ping Test deadline in seconds.
+        use_cache: Whether to read and write the on-disk cache.
+        cache_ttl: Seconds to trust a cached availability result.
+        use_regional_listing: Try the regional listing shortcut before the Ping Test.
+
+    Returns:
+        Dict[str, List[Any]]: Available PublisherModel objects, keyed by publisher.
+    """
+    # Resolve Application Default Credentials once and share them between both channels,
+    # so the lookup and token refresh are not repeated per endpoint.
+    credentials, _ = google.auth.default(scopes=ModelGardenServiceGrpcAsyncIOTransport.AUTH_SCOPES)
+
+    discovery_client = create_client(DISCOVERY_ENDPOINT, credentials)
+    region_client = None
+    # The discovery catalog is the answer for us-central1, so no second client (and
+    # channel) is needed there; fetch_models asserts this.
+    if region != "us-central1":
+        # Client for the target region, used for the regional listing and the "Ping Test"
+        region_client = create_client(f"{region}-aiplatform.googleapis.com", credentials)
+
+    # One cache dict is shared by all publishers and written to disk once.
+    cache = load_cache() if use_cache else {}
+    results = {}
+    try:
+        # Publishers run one at a time so --max-workers and --max-qps bound the
+        # total load on the regional endpoint, not the load per publisher.
+        for publisher in publishers:
+            logger.info(f"--- Processing Publisher: {publisher} ---")
+            results[publisher] = await fetch_models(
+                project_id, region, publisher,
+                discovery_client=discovery_client, region_client=region_client, cache=cache,
+                max_qps=max_qps, max_workers=max_workers, rpc_timeout=rpc_timeout, cache_ttl=cache_ttl,
+                use_regional_listing=use_regional_listing,
+            )
+    finally:
+        await discovery_client.transport.close()
+        if region_client is not None:
+            await region_client.transport.close()
+        # Save even if a publisher failed, so completed checks are not lost.
+        if use_cache:
+            save_cache(cache, max_age=max(cache_ttl, CATALOG_CACHE_TTL))
+    return results
+
 def main():
     load_dotenv()
 
@@ -187,6 +629,12 @@ def main():
     parser.add_argument("--region", help="GCP Region (e.g., europe-west4)")
     parser.add_argument("--publisher", default="google", help="Model Publisher(s). Can be 'all', a single publisher ('google'), or comma-separated ('google,anthropic'). Default: google")
     parser.add_argument("--json", action="store_true", help="Output results as a JSON array (useful for Terraform/Automation).")
+    parser.add_argument("--max-qps", type=positive_float, help="Maximum Ping Tests started per second against the regional API. Default: unlimited")
+    parser.add_argument("--max-workers", type=positive_int, default=MAX_CONCURRENT_CHECKS, help=f"Maximum Ping Tests in flight at once. Lower this if you hit 429s. Default: {MAX_CONCURRENT_CHECKS}")
+    parser.add_argument("--rpc-timeout", type=positive_float, default=PING_TIMEOUT, help=f"Per-attempt Ping Test deadline in seconds. Default: {PING_TIMEOUT}")
+    parser.add_argument("--cache-ttl", type=positive_int, default=AVAILABILITY_CACHE_TTL, help=f"Seconds to trust cached regional availability results. Default: {AVAILABILITY_CACHE_TTL}")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the on-disk cache and query the API for everything.")
+    parser.add_argument("--trust-regional-listing", action="store_true", help="Use the regional endpoint's model listing (when it serves one) instead of pinging each model. Faster, but relies on the region filtering its listing.")
     
     args = parser.parse_args()
 
@@ -204,10 +652,21 @@ def main():
     total_found = 0
     all_found_models = []
     
-    for publisher in target_publishers:
-        logger.info(f"--- Processing Publisher: {publisher} ---")
-        models = fetch_models(project_id, region, publisher)
-        
+    try:
+        results = asyncio.run(fetch_all_models(
+            project_id, region, target_publishers,
+            max_qps=args.max_qps,
+            max_workers=args.max_workers,
+            rpc_timeout=args.rpc_timeout,
+            use_cache=not args.no_cache,
+            cache_ttl=args.cache_ttl,
+            use_regional_listing=args.trust_regional_listing,
+        ))
+    except DiscoveryError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    for publisher, models in results.items():
         if models:
             total_found += len(models)
             all_found_models.extend(models)
@@ -227,8 +686,8 @@ def main():
     elif all_found_models:
         # Standard Human-Readable Output
         print(f"\n# Models available in {region} for publisher(s): {args.publisher}")
-        for model in all_found_models:
-             print(f"- {model.name}:predict")
+        # Emit the list in a single write rather than one syscall per model.
+        sys.stdout.write("".join(f"- {model.name}:predict\n" for model in all_found_models))
         
 if __name__ == "__main__":
     main()